@@ -8,6 +8,7 @@ Loads YAML configuration from file with sensible defaults and validation.
 Supports environment variable substitution using ${ENV_VAR} syntax.
 Supports encrypted configuration values using ENC[...] syntax.
 """
+import functools
 import os
 import re
 from dataclasses import dataclass, field
@@ -21,6 +22,9 @@ from caracal.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _expand_env_vars(value: Any) -> Any:
     """
@@ -393,6 +397,27 @@ def get_default_config() -> CaracalConfig:
     )
 
 
+@functools.lru_cache(maxsize=64)
+def _read_config_file(config_path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML configuration file.
+    
+    Cached on (path, mtime, size) so repeated loads of an unchanged file skip
+    YAML parsing; any rewrite changes the key and busts the cache. Callers
+    must not mutate the returned data.
+    
+    Args:
+        config_path: Resolved path to configuration file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+        size: File size in bytes (cache key only)
+    
+    Returns:
+        Parsed YAML document
+    """
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
 def load_config(config_path: Optional[str] = None) -> CaracalConfig:
     """
     Load configuration from YAML file with validation.
@@ -422,8 +447,10 @@ def load_config(config_path: Optional[str] = None) -> CaracalConfig:
     
     # Load YAML file
     try:
-        with open(config_path, 'r') as f:
-            config_data = yaml.safe_load(f)
+        stat = os.stat(config_path)
+        config_data = _read_config_file(
+            os.path.realpath(config_path), stat.st_mtime_ns, stat.st_size
+        )
         logger.debug(f"Loaded configuration from {config_path}")
     except yaml.YAMLError as e:
         logger.error(f"Failed to parse YAML configuration file '{config_path}': {e}", exc_info=True)
@@ -441,7 +468,8 @@ def load_config(config_path: Optional[str] = None) -> CaracalConfig:
         logger.info(f"Configuration file {config_path} is empty, using defaults")
         return get_default_config()
     
-    # Expand environment variables in configuration
+    # Expand environment variables in configuration. This rebuilds every
+    # dict and list, so later steps never mutate the cached parse result.
     config_data = _expand_env_vars(config_data)
     logger.debug("Expanded environment variables in configuration")
     
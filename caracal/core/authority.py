@@ -16,6 +16,7 @@ from uuid import UUID
 from sqlalchemy.orm import Session
 
 from caracal.core.crypto import verify_mandate_signature
+from caracal.core.patterns import compile_wildcard
 from caracal.db.models import ExecutionMandate, Principal
 from caracal.logging_config import get_logger
 
@@ -150,10 +151,7 @@ class AuthorityEvaluator:
         
         # Wildcard match
         if '*' in pattern:
-            import re
-            regex_pattern = pattern.replace('*', '.*')
-            regex_pattern = f"^{regex_pattern}$"
-            if re.match(regex_pattern, value):
+            if compile_wildcard(pattern).match(value):
                 return True
         
         return False
@@ -231,11 +229,6 @@ class AuthorityEvaluator:
         if current_time is None:
             current_time = datetime.utcnow()
         
-        logger.info(
-            f"Validating mandate {mandate.mandate_id} for action={requested_action}, "
-            f"resource={requested_resource}"
-        )
-        
         # Fail-closed: If mandate is None, deny
         if mandate is None:
             reason = "No mandate provided"
@@ -257,6 +250,11 @@ class AuthorityEvaluator:
             )
             return decision
         
+        logger.info(
+            f"Validating mandate {mandate.mandate_id} for action={requested_action}, "
+            f"resource={requested_resource}"
+        )
+        
         # Check revocation status first (fail fast)
         if mandate.revoked:
             reason = f"Mandate {mandate.mandate_id} is revoked"
@@ -81,6 +81,7 @@ class AgentRegistry:
         self.delegation_token_manager = delegation_token_manager
         self._agents: Dict[str, AgentIdentity] = {}
         self._names: Dict[str, str] = {}  # name -> agent_id mapping for uniqueness
+        self._children: Dict[str, List[str]] = {}  # parent_id -> child ids, in registration order
         
         # Ensure parent directory exists
         self.registry_path.parent.mkdir(parents=True, exist_ok=True)
@@ -164,6 +165,8 @@ class AgentRegistry:
         # Add to registry
         self._agents[agent_id] = agent
         self._names[name] = agent_id
+        if parent_agent_id is not None:
+            self._children.setdefault(parent_agent_id, []).append(agent_id)
         
         # Persist to disk
         try:
@@ -224,6 +227,7 @@ class AgentRegistry:
         
         # Update fields
         agent.parent_agent_id = parent_agent_id
+        self._rebuild_children_index()
         
         # Persist
         self._persist()
@@ -267,16 +271,21 @@ class AgentRegistry:
         Returns:
             List of AgentIdentity objects that are direct children of the agent
         """
-        children = [
-            agent for agent in self._agents.values()
-            if agent.parent_agent_id == agent_id
-        ]
+        children = []
+        for child_id in self._children.get(agent_id, ()):
+            child = self._agents.get(child_id)
+            if child is not None:
+                children.append(child)
         logger.debug(f"Found {len(children)} direct children for agent {agent_id}")
         return children
 
     def get_descendants(self, agent_id: str) -> List[AgentIdentity]:
         """
-        Get all descendants (children, grandchildren, etc.) recursively.
+        Get all descendants (children, grandchildren, etc.).
+        
+        Each agent's children are listed together, followed by each child's
+        own descendants in turn. The tree is walked with an explicit stack, so
+        depth is not bounded by the recursion limit.
         
         Args:
             agent_id: The ancestor agent's unique identifier
@@ -285,16 +294,21 @@ class AgentRegistry:
             List of all AgentIdentity objects in the descendant tree
         """
         descendants = []
-        
-        # Get direct children
-        children = self.get_children(agent_id)
-        
-        # Add children to descendants
-        descendants.extend(children)
-        
-        # Recursively get descendants of each child
-        for child in children:
-            descendants.extend(self.get_descendants(child.agent_id))
+        seen = {agent_id}
+        stack = [agent_id]
+        
+        while stack:
+            # Skip agents already visited, so a corrupt registry with a
+            # parent cycle cannot loop forever
+            children = [
+                child for child in self.get_children(stack.pop())
+                if child.agent_id not in seen
+            ]
+            seen.update(child.agent_id for child in children)
+            descendants.extend(children)
+            
+            # Visit the first child's subtree before the second's
+            stack.extend(child.agent_id for child in reversed(children))
         
         logger.debug(f"Found {len(descendants)} total descendants for agent {agent_id}")
         return descendants
@@ -453,6 +467,14 @@ class AgentRegistry:
             # Backup failure shouldn't prevent writes
             logger.warning(f"Failed to create backup of agent registry: {e}")
 
+    def _rebuild_children_index(self) -> None:
+        """Rebuild the parent -> children index from the agents in registration order."""
+        children: Dict[str, List[str]] = {}
+        for agent in self._agents.values():
+            if agent.parent_agent_id is not None:
+                children.setdefault(agent.parent_agent_id, []).append(agent.agent_id)
+        self._children = children
+
     def _load(self) -> None:
         """
         Load registry from disk.
@@ -472,6 +494,7 @@ class AgentRegistry:
                 agent = AgentIdentity.from_dict(agent_data)
                 self._agents[agent.agent_id] = agent
                 self._names[agent.name] = agent.agent_id
+            self._rebuild_children_index()
             
             logger.debug(f"Loaded {len(self._agents)} agents from {self.registry_path}")
                 
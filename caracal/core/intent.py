@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from uuid import UUID, uuid4
 
+from caracal.core.patterns import compile_wildcard
+
 
 @dataclass
 class Intent:
@@ -238,11 +240,7 @@ class IntentHandler:
             
             # Wildcard match - convert glob pattern to simple matching
             if '*' in pattern:
-                # Replace * with .* for regex-like matching
-                import re
-                regex_pattern = pattern.replace('*', '.*')
-                regex_pattern = f"^{regex_pattern}$"
-                if re.match(regex_pattern, resource):
+                if compile_wildcard(pattern).match(resource):
                     return True
         
         return False
@@ -8,15 +8,22 @@ This module provides the LedgerWriter for appending events to an immutable ledge
 and LedgerQuery for querying ledger events.
 """
 
+import atexit
 import fcntl
 import json
+import mmap
 import os
+import re
 import shutil
+import sys
+import threading
+import weakref
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from caracal.exceptions import (
     FileReadError,
@@ -30,6 +37,53 @@ from caracal.core.retry import retry_on_transient_failure
 
 logger = get_logger(__name__)
 
+# Pre-built JSON Lines template matching the key order and compact
+# separators produced by LedgerEvent.to_json_line().
+_JSON_LINE_TEMPLATE = (
+    '{"event_id":%d,"agent_id":%s,"timestamp":%s,'
+    '"resource_type":%s,"quantity":%s%s}'
+)
+
+# Plain non-negative decimal strings ("12", "0.50") need no Decimal parse
+_PLAIN_QUANTITY_RE = re.compile(r'[0-9]+(?:\.[0-9]+)?')
+
+
+def _intern(value: Any) -> Any:
+    """
+    Intern a string so repeated IDs and resource types share one object.
+    
+    Non-string values (e.g. from malformed ledger lines) are returned unchanged.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _json_string_needles(value: str) -> tuple:
+    """
+    Byte forms a string takes when JSON-encoded in a ledger line.
+    
+    Covers the ASCII-escaped form LedgerWriter emits and the raw UTF-8 form
+    other JSON encoders may produce.
+    """
+    ascii_form = encode_basestring_ascii(value).encode('ascii')
+    utf8_form = json.dumps(value, ensure_ascii=False).encode('utf-8')
+    if ascii_form == utf8_form:
+        return (ascii_form,)
+    return (ascii_form, utf8_form)
+
+
+# Writers that may hold buffered events; flushed once at interpreter exit.
+_open_writers: "weakref.WeakSet[LedgerWriter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_writers() -> None:
+    """Flush and close every live LedgerWriter at interpreter shutdown."""
+    for writer in list(_open_writers):
+        try:
+            writer.close()
+        except Exception as e:
+            logger.warning(f"Failed to close ledger writer {writer.ledger_path}: {e}")
+
 
 @dataclass
 class LedgerEvent:
@@ -62,6 +116,27 @@ class LedgerEvent:
         """Convert to JSON Lines format (single line JSON)."""
         return json.dumps(self.to_dict(), separators=(',', ':'))
 
+    def to_json_line_fast(self) -> str:
+        """
+        Convert to JSON Lines format without building an intermediate dict.
+        
+        Produces output identical to to_json_line(), but interpolates the
+        fixed fields into a pre-built template and only runs the JSON
+        encoder on string values and metadata.
+        """
+        if self.metadata is None:
+            metadata = ''
+        else:
+            metadata = ',"metadata":' + json.dumps(self.metadata, separators=(',', ':'))
+        return _JSON_LINE_TEMPLATE % (
+            self.event_id,
+            encode_basestring_ascii(self.agent_id),
+            encode_basestring_ascii(self.timestamp),
+            encode_basestring_ascii(self.resource_type),
+            encode_basestring_ascii(self.quantity),
+            metadata,
+        )
+
 
 class LedgerWriter:
     """
@@ -77,16 +152,24 @@ class LedgerWriter:
     
     """
 
-    def __init__(self, ledger_path: str, backup_count: int = 3):
+    def __init__(self, ledger_path: str, backup_count: int = 3, flush_every_n: int = 1):
         """
         Initialize LedgerWriter.
         
         Args:
             ledger_path: Path to the ledger file (JSON Lines format)
             backup_count: Number of rolling backups to maintain (default: 3)
+            flush_every_n: Number of events to buffer before writing and
+                fsyncing them as one batch (default: 1, every event is
+                durable on return). Buffered events are written on flush(),
+                close(), garbage collection or interpreter exit.
         """
+        if flush_every_n < 1:
+            raise ValueError(f"flush_every_n must be at least 1, got {flush_every_n}")
+        
         self.ledger_path = Path(ledger_path)
         self.backup_count = backup_count
+        self.flush_every_n = flush_every_n
         self._next_event_id = 1
         self._backup_created = False
         
@@ -101,6 +184,16 @@ class LedgerWriter:
             # Load existing ledger to determine next event ID
             self._initialize_event_id()
             logger.info(f"Loaded existing ledger from {self.ledger_path}, next event ID: {self._next_event_id}")
+        
+        # Guards event ID allocation and the append that follows it, so
+        # concurrent callers get unique IDs written in increasing order
+        self._lock = threading.Lock()
+        
+        # Append handle opened on first write and kept for the writer's
+        # lifetime, plus serialized lines not yet written to it
+        self._file = None
+        self._pending: List[str] = []
+        _open_writers.add(self)
             
         logger.info("LedgerWriter initialized")
 
@@ -108,7 +201,7 @@ class LedgerWriter:
         self,
         agent_id: str,
         resource_type: str,
-        quantity: Decimal,
+        quantity: Union[str, int, Decimal],
         metadata: Optional[Dict[str, Any]] = None,
         timestamp: Optional[datetime] = None,
     ) -> LedgerEvent:
@@ -116,12 +209,15 @@ class LedgerWriter:
         Append an event to the ledger.
         
         This method is thread-safe and uses file locking to prevent concurrent writes.
-        Writes are flushed immediately to ensure durability.
+        Writes are flushed immediately to ensure durability, unless the writer
+        was created with flush_every_n > 1.
         
         Args:
             agent_id: Agent identifier
             resource_type: Type of resource consumed
-            quantity: Amount of resource consumed
+            quantity: Amount of resource consumed. Plain decimal strings such
+                as "1.50" are stored as-is; other strings, ints and Decimals
+                are stored in canonical Decimal form.
             metadata: Optional additional context
             timestamp: Optional timestamp (defaults to current UTC time)
             
@@ -133,38 +229,31 @@ class LedgerWriter:
             InvalidLedgerEventError: If event data is invalid
         """
         # Validate inputs
-        if not agent_id:
-            logger.warning("Ledger write validation failed: agent_id cannot be empty")
-            raise InvalidLedgerEventError("agent_id cannot be empty")
-        if not resource_type:
-            logger.warning("Ledger write validation failed: resource_type cannot be empty")
-            raise InvalidLedgerEventError("resource_type cannot be empty")
-        if quantity < 0:
-            logger.warning(f"Ledger write validation failed: quantity must be non-negative, got {quantity}")
-            raise InvalidLedgerEventError(f"quantity must be non-negative, got {quantity}")
-        
-        # Create backup on first write (if not already created)
-        if not self._backup_created and self.ledger_path.exists() and self.ledger_path.stat().st_size > 0:
-            self._create_backup()
-            self._backup_created = True
+        quantity_str = self._validate_event_input(agent_id, resource_type, quantity)
         
         # Use provided timestamp or current UTC time
         if timestamp is None:
             timestamp = datetime.utcnow()
         
-        # Create ledger event
-        event = LedgerEvent(
-            event_id=self._get_next_event_id(),
-            agent_id=agent_id,
-            timestamp=timestamp.isoformat() + "Z",
-            resource_type=resource_type,
-            quantity=str(quantity),
-            metadata=metadata,
-        )
-        
         # Write to ledger with file locking
         try:
-            self._atomic_append(event)
+            # Hold the writer lock from ID allocation through the append so
+            # events reach the file in event_id order; _initialize_event_id
+            # relies on the last line carrying the highest ID
+            with self._lock:
+                self._ensure_backup()
+                
+                # Create ledger event
+                event = LedgerEvent(
+                    event_id=self._get_next_event_id(),
+                    agent_id=agent_id,
+                    timestamp=timestamp.isoformat() + "Z",
+                    resource_type=resource_type,
+                    quantity=quantity_str,
+                    metadata=metadata,
+                )
+                
+                self._enqueue([event])
             
             logger.info(
                 f"Ledger write: event_id={event.event_id}, agent_id={agent_id}, "
@@ -180,14 +269,159 @@ class LedgerWriter:
                 f"Failed to append event to ledger {self.ledger_path}: {e}"
             ) from e
 
+    def append_events(self, events: Iterable[Dict[str, Any]]) -> List[LedgerEvent]:
+        """
+        Append several events to the ledger under one lock, write and fsync.
+        
+        Each item takes the same keys as the append_event arguments:
+        agent_id, resource_type and quantity are required, metadata and
+        timestamp are optional. All items are validated before any is
+        written, and event IDs are assigned in the order given.
+        
+        Args:
+            events: Event field mappings to append
+            
+        Returns:
+            List of created LedgerEvent objects, in input order
+            
+        Raises:
+            LedgerWriteError: If write operation fails
+            InvalidLedgerEventError: If any event data is invalid
+        """
+        # Validate every event before allocating IDs or touching the file
+        prepared = []
+        for spec in events:
+            if 'quantity' not in spec:
+                logger.warning("Ledger write validation failed: quantity is required")
+                raise InvalidLedgerEventError("quantity is required")
+            agent_id = spec.get('agent_id')
+            resource_type = spec.get('resource_type')
+            quantity_str = self._validate_event_input(agent_id, resource_type, spec['quantity'])
+            timestamp = spec.get('timestamp') or datetime.utcnow()
+            prepared.append((agent_id, resource_type, quantity_str, spec.get('metadata'), timestamp))
+        
+        if not prepared:
+            return []
+        
+        try:
+            with self._lock:
+                self._ensure_backup()
+                
+                created = [
+                    LedgerEvent(
+                        event_id=self._get_next_event_id(),
+                        agent_id=agent_id,
+                        timestamp=timestamp.isoformat() + "Z",
+                        resource_type=resource_type,
+                        quantity=quantity_str,
+                        metadata=metadata,
+                    )
+                    for agent_id, resource_type, quantity_str, metadata, timestamp in prepared
+                ]
+                
+                self._enqueue(created)
+            
+            logger.info(
+                f"Ledger write: {len(created)} events, "
+                f"event_ids={created[0].event_id}-{created[-1].event_id}"
+            )
+            return created
+        except (OSError, IOError) as e:
+            logger.error(
+                f"Failed to append events to ledger {self.ledger_path}: {e}",
+                exc_info=True
+            )
+            raise LedgerWriteError(
+                f"Failed to append events to ledger {self.ledger_path}: {e}"
+            ) from e
+
+    def _validate_event_input(
+        self,
+        agent_id: str,
+        resource_type: str,
+        quantity: Union[str, int, Decimal],
+    ) -> str:
+        """
+        Validate event fields and return the quantity as a string.
+        
+        Raises:
+            InvalidLedgerEventError: If event data is invalid
+        """
+        if not agent_id:
+            logger.warning("Ledger write validation failed: agent_id cannot be empty")
+            raise InvalidLedgerEventError("agent_id cannot be empty")
+        if not resource_type:
+            logger.warning("Ledger write validation failed: resource_type cannot be empty")
+            raise InvalidLedgerEventError("resource_type cannot be empty")
+        if isinstance(quantity, str):
+            if _PLAIN_QUANTITY_RE.fullmatch(quantity):
+                return quantity
+            try:
+                value = Decimal(quantity)
+            except InvalidOperation as e:
+                logger.warning(f"Ledger write validation failed: quantity is not a decimal, got {quantity!r}")
+                raise InvalidLedgerEventError(f"quantity is not a decimal, got {quantity!r}") from e
+        elif isinstance(quantity, Decimal):
+            value = quantity
+        elif isinstance(quantity, int) and not isinstance(quantity, bool):
+            value = Decimal(quantity)
+        else:
+            logger.warning(
+                f"Ledger write validation failed: quantity must be a str, int or Decimal, "
+                f"got {type(quantity).__name__}"
+            )
+            raise InvalidLedgerEventError(
+                f"quantity must be a str, int or Decimal, got {type(quantity).__name__}"
+            )
+        if not value.is_finite():
+            logger.warning(f"Ledger write validation failed: quantity must be finite, got {quantity}")
+            raise InvalidLedgerEventError(f"quantity must be finite, got {quantity}")
+        if value < 0:
+            logger.warning(f"Ledger write validation failed: quantity must be non-negative, got {quantity}")
+            raise InvalidLedgerEventError(f"quantity must be non-negative, got {quantity}")
+        return str(value)
+
+    def _ensure_backup(self) -> None:
+        """Create a backup before the first write to a non-empty ledger."""
+        if not self._backup_created and self.ledger_path.exists() and self.ledger_path.stat().st_size > 0:
+            self._create_backup()
+            self._backup_created = True
+
+    def _enqueue(self, events: List[LedgerEvent]) -> None:
+        """
+        Queue events and write the batch once flush_every_n events are pending.
+        
+        If the write fails, the events from this call are dropped from the
+        queue because the caller is told they failed; events buffered by
+        earlier calls stay queued for the next flush.
+        
+        Args:
+            events: LedgerEvents to append
+            
+        Raises:
+            OSError: If write operation fails after all retries
+            TypeError: If event metadata is not JSON serializable
+        """
+        # Serialize the whole call before queueing any of it, so an event
+        # that cannot be encoded leaves nothing from this call behind
+        lines = [event.to_json_line_fast() + '\n' for event in events]
+        mark = len(self._pending)
+        self._pending.extend(lines)
+        if len(self._pending) >= self.flush_every_n:
+            try:
+                self._write_pending()
+            except (OSError, IOError):
+                del self._pending[mark:]
+                raise
+
     @retry_on_transient_failure(max_retries=3, base_delay=0.1, backoff_factor=2.0)
-    def _atomic_append(self, event: LedgerEvent) -> None:
+    def _write_pending(self) -> None:
         """
-        Perform atomic append operation with file locking.
+        Perform atomic append of all pending events with file locking.
         
         Steps:
         1. Acquire exclusive file lock
-        2. Append event as JSON line
+        2. Append pending events as JSON lines
         3. Flush write buffer to OS
         4. Force OS to write to physical disk (fsync)
         5. Release file lock
@@ -197,21 +431,27 @@ class LedgerWriter:
         - Uses exponential backoff: 0.1s, 0.2s, 0.4s
         - Fails permanently after max retries
         
-        Args:
-            event: LedgerEvent to append
-            
+        Pending events are only discarded once they have been written, so a
+        retry re-sends the whole batch.
+        
         Raises:
             OSError: If write operation fails after all retries
         """
-        # Open file in append mode
-        with open(self.ledger_path, 'a') as f:
+        if not self._pending:
+            return
+        
+        # Open the append handle once and reuse it for later batches
+        if self._file is None:
+            self._file = open(self.ledger_path, 'a', buffering=65536)
+        f = self._file
+        
+        try:
             # Acquire exclusive lock (blocks until available)
             fcntl.flock(f.fileno(), fcntl.LOCK_EX)
             
             try:
-                # Write event as JSON line
-                json_line = event.to_json_line()
-                f.write(json_line + '\n')
+                # Write the batch as JSON lines
+                f.write(''.join(self._pending))
                 
                 # Flush write buffer to OS
                 f.flush()
@@ -220,13 +460,76 @@ class LedgerWriter:
                 os.fsync(f.fileno())
                 
             finally:
-                # Release lock (automatically released on close, but explicit is better)
+                # Release lock (the next batch reuses this handle)
                 fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        except (OSError, IOError):
+            # Drop a possibly broken handle so the retry reopens the file
+            self._file = None
+            try:
+                f.close()
+            except (OSError, IOError):
+                pass
+            raise
+        
+        self._pending.clear()
+
+    def flush(self) -> None:
+        """
+        Write and fsync any buffered events.
+        
+        Raises:
+            LedgerWriteError: If write operation fails
+        """
+        try:
+            with self._lock:
+                self._write_pending()
+        except (OSError, IOError) as e:
+            logger.error(
+                f"Failed to flush events to ledger {self.ledger_path}: {e}",
+                exc_info=True
+            )
+            raise LedgerWriteError(
+                f"Failed to flush events to ledger {self.ledger_path}: {e}"
+            ) from e
+
+    def close(self) -> None:
+        """
+        Flush buffered events and close the ledger file handle.
+        
+        The writer may still be used afterwards; the next write reopens the file.
+        
+        Raises:
+            LedgerWriteError: If buffered events cannot be written
+        """
+        self.flush()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __enter__(self) -> "LedgerWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        # The atexit hook only reaches writers that are still alive, so a
+        # writer dropped without close() writes its buffered events and
+        # releases its append handle here
+        if not getattr(self, '_pending', None) and getattr(self, '_file', None) is None:
+            return
+        try:
+            self.close()
+        except Exception as e:
+            logger.warning(f"Failed to close ledger writer {self.ledger_path}: {e}")
 
     def _get_next_event_id(self) -> int:
         """
         Get the next monotonically increasing event ID.
         
+        Callers must hold self._lock.
+        
         Returns:
             int: Next event ID
         """
@@ -302,17 +605,25 @@ class LedgerWriter:
             return
         
         try:
+            # Find existing backup numbers with a single directory scan
+            # instead of one stat() per slot
+            prefix = f"{self.ledger_path.name}.bak."
+            existing = set()
+            with os.scandir(self.ledger_path.parent) as entries:
+                for entry in entries:
+                    suffix = entry.name[len(prefix):]
+                    if entry.name.startswith(prefix) and suffix.isdigit():
+                        existing.add(int(suffix))
+            
             # Delete oldest backup if it exists
-            oldest_backup = Path(f"{self.ledger_path}.bak.{self.backup_count}")
-            if oldest_backup.exists():
-                oldest_backup.unlink()
+            if self.backup_count in existing:
+                Path(f"{self.ledger_path}.bak.{self.backup_count}").unlink()
             
             # Rotate existing backups (from newest to oldest)
             for i in range(self.backup_count - 1, 0, -1):
-                old_backup = Path(f"{self.ledger_path}.bak.{i}")
-                new_backup = Path(f"{self.ledger_path}.bak.{i + 1}")
-                
-                if old_backup.exists():
+                if i in existing:
+                    old_backup = Path(f"{self.ledger_path}.bak.{i}")
+                    new_backup = Path(f"{self.ledger_path}.bak.{i + 1}")
                     old_backup.rename(new_backup)
             
             # Create new backup
@@ -354,6 +665,43 @@ class LedgerQuery:
             
         logger.info("LedgerQuery initialized")
 
+    def _iter_lines(self, needles: Optional[tuple] = None):
+        """
+        Yield (line_num, raw_line) pairs from a read-only memory map of the ledger.
+        
+        Lines containing none of the given byte needles are skipped without
+        being copied out of the map or parsed. The scan covers the file as
+        it was when mapped; events appended later are not seen.
+        
+        Args:
+            needles: Optional byte strings a line must contain to be yielded
+        """
+        with open(self.ledger_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            # mmap cannot map an empty file
+            if size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # The scan reads front to back once; let the kernel read
+                # ahead aggressively (not available on every platform)
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                start = 0
+                line_num = 0
+                while start < size:
+                    end = mm.find(b'\n', start)
+                    if end == -1:
+                        end = size
+                    line_num += 1
+                    if needles and not any(
+                        mm.find(needle, start, end) != -1 for needle in needles
+                    ):
+                        start = end + 1
+                        continue
+                    line = mm[start:end]
+                    start = end + 1
+                    yield line_num, line
+
     def get_events(
         self,
         agent_id: Optional[str] = None,
@@ -382,64 +730,68 @@ class LedgerQuery:
         events = []
         
         try:
-            with open(self.ledger_path, 'r') as f:
-                for line_num, line in enumerate(f, start=1):
-                    line = line.strip()
-                    if not line:
-                        # Skip empty lines
+            # Lines that cannot mention the agent are rejected before parsing
+            needles = _json_string_needles(agent_id) if agent_id is not None else None
+            for line_num, line in self._iter_lines(needles):
+                line = line.strip()
+                if not line:
+                    # Skip empty lines
+                    continue
+                
+                try:
+                    # Parse JSON line
+                    event_data = json.loads(line)
+                    event = LedgerEvent.from_dict(event_data)
+                    
+                    # Apply filters
+                    if agent_id is not None and event.agent_id != agent_id:
                         continue
                     
-                    try:
-                        # Parse JSON line
-                        event_data = json.loads(line)
-                        event = LedgerEvent.from_dict(event_data)
-                        
-                        # Apply filters
-                        if agent_id is not None and event.agent_id != agent_id:
+                    if resource_type is not None and event.resource_type != resource_type:
+                        continue
+                    
+                    # Parse timestamp for time-based filtering
+                    # Timestamps are in ISO 8601 format with 'Z' suffix
+                    event_timestamp = datetime.fromisoformat(
+                        event.timestamp.replace('Z', '+00:00')
+                    )
+                    
+                    # Make comparison timezone-aware if needed
+                    if start_time is not None:
+                        # If start_time is naive, make it UTC-aware for comparison
+                        compare_start = start_time
+                        if start_time.tzinfo is None:
+                            from datetime import timezone
+                            compare_start = start_time.replace(tzinfo=timezone.utc)
+                        if event_timestamp < compare_start:
                             continue
-                        
-                        if resource_type is not None and event.resource_type != resource_type:
+                    
+                    if end_time is not None:
+                        # If end_time is naive, make it UTC-aware for comparison
+                        compare_end = end_time
+                        if end_time.tzinfo is None:
+                            from datetime import timezone
+                            compare_end = end_time.replace(tzinfo=timezone.utc)
+                        if event_timestamp > compare_end:
                             continue
-                        
-                        # Parse timestamp for time-based filtering
-                        # Timestamps are in ISO 8601 format with 'Z' suffix
-                        event_timestamp = datetime.fromisoformat(
-                            event.timestamp.replace('Z', '+00:00')
-                        )
-                        
-                        # Make comparison timezone-aware if needed
-                        if start_time is not None:
-                            # If start_time is naive, make it UTC-aware for comparison
-                            compare_start = start_time
-                            if start_time.tzinfo is None:
-                                from datetime import timezone
-                                compare_start = start_time.replace(tzinfo=timezone.utc)
-                            if event_timestamp < compare_start:
-                                continue
-                        
-                        if end_time is not None:
-                            # If end_time is naive, make it UTC-aware for comparison
-                            compare_end = end_time
-                            if end_time.tzinfo is None:
-                                from datetime import timezone
-                                compare_end = end_time.replace(tzinfo=timezone.utc)
-                            if event_timestamp > compare_end:
-                                continue
-                        
-                        # Event matches all filters
-                        events.append(event)
-                        
-                    except json.JSONDecodeError as e:
-                        logger.warning(
-                            f"Skipping malformed JSON at line {line_num} in {self.ledger_path}: {e}"
-                        )
-                        continue
-                    except Exception as e:
-                        logger.warning(
-                            f"Error processing event at line {line_num} in {self.ledger_path}: {e}"
-                        )
-                        continue
-            
+                    
+                    # Event matches all filters. Agent IDs and resource
+                    # types repeat across events, so share one string each
+                    event.agent_id = _intern(event.agent_id)
+                    event.resource_type = _intern(event.resource_type)
+                    events.append(event)
+                    
+                except json.JSONDecodeError as e:
+                    logger.warning(
+                        f"Skipping malformed JSON at line {line_num} in {self.ledger_path}: {e}"
+                    )
+                    continue
+                except Exception as e:
+                    logger.warning(
+                        f"Error processing event at line {line_num} in {self.ledger_path}: {e}"
+                    )
+                    continue
+        
             logger.debug(
                 f"Query returned {len(events)} events "
                 f"(agent_id={agent_id}, start_time={start_time}, "
@@ -18,6 +18,7 @@ from sqlalchemy.orm import Session
 
 from caracal.core.crypto import sign_mandate
 from caracal.core.intent import Intent
+from caracal.core.patterns import compile_wildcard
 from caracal.db.models import ExecutionMandate, AuthorityPolicy, Principal
 from caracal.logging_config import get_logger
 
@@ -145,10 +146,7 @@ class MandateManager:
         
         # Wildcard match
         if '*' in pattern:
-            import re
-            regex_pattern = pattern.replace('*', '.*')
-            regex_pattern = f"^{regex_pattern}$"
-            if re.match(regex_pattern, value):
+            if compile_wildcard(pattern).match(value):
                 return True
         
         return False
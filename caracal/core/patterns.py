@@ -0,0 +1,29 @@
+"""
+Copyright (C) 2026 Garudex Labs.  All Rights Reserved.
+Caracal, a product of Garudex Labs
+
+Wildcard pattern matching for Caracal Core.
+
+This module provides the compiled ``*`` wildcard patterns shared by
+authority evaluation, mandate management and intent scoping.
+"""
+
+import functools
+import re
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_wildcard(pattern: str) -> re.Pattern[str]:
+    """
+    Compile a ``*`` wildcard pattern into an anchored regex.
+
+    Mandate and intent scopes repeat across validations, so each pattern
+    is translated and compiled once and reused.
+
+    Args:
+        pattern: Pattern where ``*`` matches any run of characters
+
+    Returns:
+        Compiled regex that matches the whole value
+    """
+    return re.compile(f"^{pattern.replace('*', '.*')}$")
@@ -135,7 +135,7 @@ class SDKBridge:
 
     def _get_default_scope(self) -> ScopeContext:
         """Fall back to default (unscoped) context."""
-        return self._client._default_scope
+        return self._client._scope
 
     def close(self) -> None:
         """Release resources."""
@@ -7,17 +7,27 @@ HTTP/REST transport adapter (default).
 
 from __future__ import annotations
 
+import functools
 import time
-from typing import Optional
-
-import httpx
+from typing import TYPE_CHECKING, Optional
 
 from caracal.logging_config import get_logger
 from caracal.sdk.adapters.base import BaseAdapter, SDKRequest, SDKResponse
 
+if TYPE_CHECKING:
+    import httpx
+
 logger = get_logger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _default_ssl_context():
+    """Build the TLS context once per process; loading the CA bundle is costly."""
+    import httpx
+
+    return httpx.create_ssl_context()
+
+
 class HttpAdapter(BaseAdapter):
     """Default HTTP transport using ``httpx.AsyncClient``.
 
@@ -44,6 +54,9 @@ class HttpAdapter(BaseAdapter):
 
     def _ensure_client(self) -> httpx.AsyncClient:
         if self._client is None:
+            # httpx is imported on first request rather than at module load
+            import httpx
+
             headers = {}
             if self._api_key:
                 headers["Authorization"] = f"Bearer {self._api_key}"
@@ -51,6 +64,7 @@ class HttpAdapter(BaseAdapter):
                 base_url=self._base_url,
                 headers=headers,
                 timeout=self._timeout,
+                verify=_default_ssl_context(),
             )
             self._connected = True
         return self._client
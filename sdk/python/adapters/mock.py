@@ -7,10 +7,14 @@ Mock transport adapter for local testing.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from caracal.sdk.adapters.base import BaseAdapter, SDKRequest, SDKResponse
 
+# Shared read-only mapping for adapters created without responses
+_NO_RESPONSES: Mapping[Tuple[str, str], SDKResponse] = MappingProxyType({})
+
 
 class MockAdapter(BaseAdapter):
     """In-memory mock adapter for unit tests.
@@ -30,7 +34,7 @@ class MockAdapter(BaseAdapter):
         self,
         responses: Optional[Dict[Tuple[str, str], SDKResponse]] = None,
     ) -> None:
-        self._responses: Dict[Tuple[str, str], SDKResponse] = responses or {}
+        self._responses: Mapping[Tuple[str, str], SDKResponse] = responses or _NO_RESPONSES
         self._sent: list[SDKRequest] = []
 
     async def send(self, request: SDKRequest) -> SDKResponse:
@@ -46,7 +50,9 @@ class MockAdapter(BaseAdapter):
         )
 
     def close(self) -> None:
-        self._responses.clear()
+        # Drop the reference rather than clearing, which would empty the
+        # caller's mapping or fail on the shared read-only one
+        self._responses = _NO_RESPONSES
         self._sent.clear()
 
     @property
@@ -70,18 +70,27 @@ class CaracalClient:
             base_url=base_url,
             api_key=api_key,
         )
-        self._context_manager = ContextManager(
-            adapter=self._adapter, hooks=self._hooks
-        )
 
-        # Default scope (no org/workspace filter)
-        self._default_scope = ScopeContext(
-            adapter=self._adapter, hooks=self._hooks
-        )
+        # Lazy singletons — built on first access so short-lived clients
+        # that never touch a scope do not pay for them
+        self._context_manager: Optional[ContextManager] = None
+        self._default_scope: Optional[ScopeContext] = None
 
         self._extensions: List[CaracalExtension] = []
         logger.info("CaracalClient initialized")
 
+    @classmethod
+    def from_api_key(
+        cls, api_key: str, *, base_url: str = "http://localhost:8000"
+    ) -> CaracalClient:
+        """Create a client with the default HTTP transport, without a builder.
+
+        Args:
+            api_key: API key for authentication.
+            base_url: Root URL of the Caracal API.
+        """
+        return cls(api_key=api_key, base_url=base_url)
+
     # -- Extension registration --------------------------------------------
 
     def use(self, extension: CaracalExtension) -> CaracalClient:
@@ -104,27 +113,40 @@ class CaracalClient:
     @property
     def context(self) -> ContextManager:
         """Context manager for scope checkout."""
+        if self._context_manager is None:
+            self._context_manager = ContextManager(
+                adapter=self._adapter, hooks=self._hooks
+            )
         return self._context_manager
 
+    @property
+    def _scope(self) -> ScopeContext:
+        """Default scope (no org/workspace filter)."""
+        if self._default_scope is None:
+            self._default_scope = ScopeContext(
+                adapter=self._adapter, hooks=self._hooks
+            )
+        return self._default_scope
+
     @property
     def agents(self):
         """Agent operations in the default (unscoped) context."""
-        return self._default_scope.agents
+        return self._scope.agents
 
     @property
     def mandates(self):
         """Mandate operations in the default (unscoped) context."""
-        return self._default_scope.mandates
+        return self._scope.mandates
 
     @property
     def delegation(self):
         """Delegation operations in the default (unscoped) context."""
-        return self._default_scope.delegation
+        return self._scope.delegation
 
     @property
     def ledger(self):
         """Ledger operations in the default (unscoped) context."""
-        return self._default_scope.ledger
+        return self._scope.ledger
 
     # -- Lifecycle ---------------------------------------------------------
 
@@ -155,6 +177,8 @@ class CaracalBuilder:
         )
     """
 
+    __slots__ = ("_api_key", "_base_url", "_adapter", "_extensions")
+
     def __init__(self) -> None:
         self._api_key: Optional[str] = None
         self._base_url: str = "http://localhost:8000"
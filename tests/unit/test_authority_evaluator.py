@@ -10,29 +10,79 @@ delegation chain checking, and fail-closed semantics.
 
 import pytest
 from datetime import datetime, timedelta
-from uuid import uuid4
+from uuid import UUID
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
 from caracal.core.authority import AuthorityEvaluator, AuthorityDecision
-from caracal.db.models import ExecutionMandate, Principal, AuthorityPolicy
+from caracal.db.models import Base, ExecutionMandate, Principal, AuthorityPolicy
 from caracal.core.crypto import sign_mandate
 
 
-@pytest.fixture
-def db_session(tmp_path):
-    """Create a test database session."""
-    from sqlalchemy import create_engine
-    from sqlalchemy.orm import sessionmaker
-    from caracal.db.models import Base
-    
-    # Use in-memory SQLite for testing
-    engine = create_engine("sqlite:///:memory:")
+# Deterministic IDs drawn from a fixed pool instead of uuid4(); the pool
+# restarts for every test, which is safe because each test's rows are
+# rolled back. The version/variant nibbles keep the hex non-numeric so
+# SQLite's NUMERIC affinity does not turn stored IDs into integers.
+_UUID_POOL = tuple(UUID(f"00000000-0000-4000-a000-{i:012x}") for i in range(1, 101))
+_uuid_iter = iter(_UUID_POOL)
+
+
+def _next_uuid() -> UUID:
+    """Return the next ID from the test UUID pool."""
+    return next(_uuid_iter)
+
+
+@pytest.fixture(autouse=True)
+def _reset_uuid_pool():
+    """Restart the UUID pool so every test sees the same IDs."""
+    global _uuid_iter
+    _uuid_iter = iter(_UUID_POOL)
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """Create the in-memory test database schema once per session."""
+    # Use in-memory SQLite for testing; StaticPool keeps the single
+    # connection (and therefore the schema) alive across sessions
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    
+    # pysqlite defers BEGIN on its own, which breaks SAVEPOINT; let
+    # SQLAlchemy emit BEGIN itself so nested transactions work
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
     Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    
+    yield engine
+    
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(db_engine):
+    """Create a test database session rolled back after each test."""
+    # Run the test inside an outer transaction; session.commit() only
+    # releases a SAVEPOINT, so the final rollback discards everything
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     
     yield session
     
     session.close()
+    transaction.rollback()
+    connection.close()
 
 
 @pytest.fixture
@@ -58,7 +108,7 @@ def test_principal(db_session):
     ).decode()
     
     principal = Principal(
-        principal_id=uuid4(),
+        principal_id=_next_uuid(),
         name="test_principal",
         principal_type="agent",
         owner="test_owner",
@@ -76,7 +126,7 @@ def test_principal(db_session):
 def test_subject(db_session):
     """Create a test subject principal."""
     subject = Principal(
-        principal_id=uuid4(),
+        principal_id=_next_uuid(),
         name="test_subject",
         principal_type="agent",
         owner="test_owner"
@@ -95,7 +145,7 @@ def valid_mandate(db_session, test_principal, test_subject):
     valid_until = valid_from + timedelta(hours=1)
     
     mandate_data = {
-        "mandate_id": str(uuid4()),
+        "mandate_id": str(_next_uuid()),
         "issuer_id": str(test_principal.principal_id),
         "subject_id": str(test_subject.principal_id),
         "valid_from": valid_from.isoformat(),
@@ -110,7 +160,7 @@ def valid_mandate(db_session, test_principal, test_subject):
     signature = sign_mandate(mandate_data, test_principal.private_key_pem)
     
     mandate = ExecutionMandate(
-        mandate_id=mandate_data["mandate_id"],
+        mandate_id=UUID(mandate_data["mandate_id"]),
         issuer_id=test_principal.principal_id,
         subject_id=test_subject.principal_id,
         valid_from=valid_from,
@@ -276,7 +326,7 @@ def test_check_delegation_chain_with_valid_parent(db_session, test_principal, te
     parent_valid_until = parent_valid_from + timedelta(hours=2)
     
     parent_mandate_data = {
-        "mandate_id": str(uuid4()),
+        "mandate_id": str(_next_uuid()),
         "issuer_id": str(test_principal.principal_id),
         "subject_id": str(test_subject.principal_id),
         "valid_from": parent_valid_from.isoformat(),
@@ -291,7 +341,7 @@ def test_check_delegation_chain_with_valid_parent(db_session, test_principal, te
     parent_signature = sign_mandate(parent_mandate_data, test_principal.private_key_pem)
     
     parent_mandate = ExecutionMandate(
-        mandate_id=parent_mandate_data["mandate_id"],
+        mandate_id=UUID(parent_mandate_data["mandate_id"]),
         issuer_id=test_principal.principal_id,
         subject_id=test_subject.principal_id,
         valid_from=parent_valid_from,
@@ -311,9 +361,9 @@ def test_check_delegation_chain_with_valid_parent(db_session, test_principal, te
     child_valid_until = child_valid_from + timedelta(hours=1)
     
     child_mandate_data = {
-        "mandate_id": str(uuid4()),
+        "mandate_id": str(_next_uuid()),
         "issuer_id": str(test_subject.principal_id),
-        "subject_id": str(uuid4()),
+        "subject_id": str(_next_uuid()),
         "valid_from": child_valid_from.isoformat(),
         "valid_until": child_valid_until.isoformat(),
         "resource_scope": ["api:openai:gpt-4"],
@@ -326,9 +376,9 @@ def test_check_delegation_chain_with_valid_parent(db_session, test_principal, te
     child_signature = sign_mandate(child_mandate_data, test_principal.private_key_pem)
     
     child_mandate = ExecutionMandate(
-        mandate_id=child_mandate_data["mandate_id"],
+        mandate_id=UUID(child_mandate_data["mandate_id"]),
         issuer_id=test_subject.principal_id,
-        subject_id=uuid4(),
+        subject_id=_next_uuid(),
         valid_from=child_valid_from,
         valid_until=child_valid_until,
         resource_scope=["api:openai:gpt-4"],
@@ -357,7 +407,7 @@ def test_check_delegation_chain_revoked_parent(db_session, test_principal, test_
     parent_valid_until = parent_valid_from + timedelta(hours=2)
     
     parent_mandate_data = {
-        "mandate_id": str(uuid4()),
+        "mandate_id": str(_next_uuid()),
         "issuer_id": str(test_principal.principal_id),
         "subject_id": str(test_subject.principal_id),
         "valid_from": parent_valid_from.isoformat(),
@@ -372,7 +422,7 @@ def test_check_delegation_chain_revoked_parent(db_session, test_principal, test_
     parent_signature = sign_mandate(parent_mandate_data, test_principal.private_key_pem)
     
     parent_mandate = ExecutionMandate(
-        mandate_id=parent_mandate_data["mandate_id"],
+        mandate_id=UUID(parent_mandate_data["mandate_id"]),
         issuer_id=test_principal.principal_id,
         subject_id=test_subject.principal_id,
         valid_from=parent_valid_from,
@@ -389,9 +439,9 @@ def test_check_delegation_chain_revoked_parent(db_session, test_principal, test_
     
     # Create child mandate
     child_mandate = ExecutionMandate(
-        mandate_id=uuid4(),
+        mandate_id=_next_uuid(),
         issuer_id=test_subject.principal_id,
-        subject_id=uuid4(),
+        subject_id=_next_uuid(),
         valid_from=datetime.utcnow(),
         valid_until=datetime.utcnow() + timedelta(hours=1),
         resource_scope=["api:openai:gpt-4"],
@@ -420,7 +470,7 @@ def test_check_delegation_chain_expired_parent(db_session, test_principal, test_
     parent_valid_until = datetime.utcnow() - timedelta(hours=1)
     
     parent_mandate_data = {
-        "mandate_id": str(uuid4()),
+        "mandate_id": str(_next_uuid()),
         "issuer_id": str(test_principal.principal_id),
         "subject_id": str(test_subject.principal_id),
         "valid_from": parent_valid_from.isoformat(),
@@ -435,7 +485,7 @@ def test_check_delegation_chain_expired_parent(db_session, test_principal, test_
     parent_signature = sign_mandate(parent_mandate_data, test_principal.private_key_pem)
     
     parent_mandate = ExecutionMandate(
-        mandate_id=parent_mandate_data["mandate_id"],
+        mandate_id=UUID(parent_mandate_data["mandate_id"]),
         issuer_id=test_principal.principal_id,
         subject_id=test_subject.principal_id,
         valid_from=parent_valid_from,
@@ -452,9 +502,9 @@ def test_check_delegation_chain_expired_parent(db_session, test_principal, test_
     
     # Create child mandate
     child_mandate = ExecutionMandate(
-        mandate_id=uuid4(),
+        mandate_id=_next_uuid(),
         issuer_id=test_subject.principal_id,
-        subject_id=uuid4(),
+        subject_id=_next_uuid(),
         valid_from=datetime.utcnow(),
         valid_until=datetime.utcnow() + timedelta(hours=1),
         resource_scope=["api:openai:gpt-4"],
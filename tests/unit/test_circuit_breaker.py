@@ -26,8 +26,7 @@ from caracal.monitoring.metrics import CircuitBreakerState
 class TestCircuitBreaker:
     """Test circuit breaker functionality."""
     
-    @pytest.mark.asyncio
-    async def test_circuit_breaker_starts_closed(self):
+    def test_circuit_breaker_starts_closed(self):
         """Test that circuit breaker starts in CLOSED state."""
         breaker = CircuitBreaker("test")
         
@@ -313,8 +312,7 @@ class TestCircuitBreakerRegistry:
         
         assert breaker1 is breaker2
     
-    @pytest.mark.asyncio
-    async def test_registry_get_returns_none_for_nonexistent(self):
+    def test_registry_get_returns_none_for_nonexistent(self):
         """Test that registry get returns None for nonexistent breaker."""
         registry = CircuitBreakerRegistry()
         
@@ -386,8 +384,7 @@ class TestCircuitBreakerRegistry:
         assert breaker1.is_closed
         assert breaker2.is_closed
     
-    @pytest.mark.asyncio
-    async def test_global_registry(self):
+    def test_global_registry(self):
         """Test global circuit breaker registry."""
         registry1 = get_circuit_breaker_registry()
         registry2 = get_circuit_breaker_registry()
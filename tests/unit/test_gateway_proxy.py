@@ -220,8 +220,7 @@ class TestGatewayProxyReplayProtection:
 class TestGatewayProxyAuthorityEvaluation:
     """Test authority (mandate) evaluation."""
     
-    @pytest.mark.asyncio
-    async def test_authority_check_allowed(
+    def test_authority_check_allowed(
         self,
         gateway_proxy,
         mock_authenticator,
@@ -296,8 +295,7 @@ class TestGatewayProxyAuthorityEvaluation:
         assert gateway_proxy._allowed_count == 1
         assert gateway_proxy._denied_count == 0
 
-    @pytest.mark.asyncio
-    async def test_authority_check_denied(
+    def test_authority_check_denied(
         self,
         gateway_proxy,
         mock_authenticator,
@@ -345,8 +343,7 @@ class TestGatewayProxyAuthorityEvaluation:
         assert response.json()["error"] == "authority_denied"
         assert gateway_proxy._denied_count == 1
 
-    @pytest.mark.asyncio
-    async def test_authority_check_missing_mandate(
+    def test_authority_check_missing_mandate(
         self,
         gateway_proxy,
         mock_authenticator,
@@ -384,8 +381,7 @@ class TestGatewayProxyAuthorityEvaluation:
 class TestGatewayProxyMetering:
     """Test usage metering."""
     
-    @pytest.mark.asyncio
-    async def test_metering_collection(
+    def test_metering_collection(
         self,
         gateway_proxy,
         mock_authenticator,
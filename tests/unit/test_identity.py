@@ -6,7 +6,7 @@ Unit tests for agent identity management.
 """
 
 import json
-import uuid
+import re
 from pathlib import Path
 
 import pytest
@@ -15,6 +15,12 @@ from caracal.core.identity import AgentIdentity, AgentRegistry
 from caracal.exceptions import DuplicateAgentNameError
 
 
+# Canonical lowercase UUID v4 (version nibble 4, RFC 4122 variant)
+_UUID4_RE = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-4[0-9a-f]{3}-[89ab][0-9a-f]{3}-[0-9a-f]{12}$"
+)
+
+
 class TestAgentIdentity:
     """Test AgentIdentity dataclass."""
 
@@ -94,11 +100,7 @@ class TestAgentRegistry:
         assert agent.metadata == {"department": "AI"}
         
         # Verify UUID v4 format
-        try:
-            uuid_obj = uuid.UUID(agent.agent_id, version=4)
-            assert str(uuid_obj) == agent.agent_id
-        except ValueError:
-            pytest.fail("Agent ID is not a valid UUID v4")
+        assert _UUID4_RE.match(agent.agent_id), "Agent ID is not a valid UUID v4"
         
         # Verify timestamp format
         assert agent.created_at.endswith("Z")
@@ -434,6 +436,29 @@ class TestAgentRegistry:
         assert grandchild1.agent_id in descendant_ids
         assert grandchild2.agent_id in descendant_ids
 
+    def test_get_descendants_after_reparent(self, temp_dir):
+        """Test that descendants follow update_agent re-parenting in order."""
+        registry_path = temp_dir / "agents.json"
+        registry = AgentRegistry(str(registry_path))
+
+        root = registry.register_agent(name="root", owner="root@example.com")
+        child1 = registry.register_agent(
+            name="child-1", owner="c1@example.com", parent_agent_id=root.agent_id
+        )
+        child2 = registry.register_agent(
+            name="child-2", owner="c2@example.com", parent_agent_id=root.agent_id
+        )
+        grandchild = registry.register_agent(
+            name="grandchild", owner="gc@example.com", parent_agent_id=child1.agent_id
+        )
+
+        registry.update_agent(grandchild.agent_id, parent_agent_id=child2.agent_id)
+
+        assert registry.get_children(child1.agent_id) == []
+        assert [d.name for d in registry.get_descendants(root.agent_id)] == [
+            "child-1", "child-2", "grandchild"
+        ]
+
     def test_parent_child_persistence(self, temp_dir):
         """Test that parent-child relationships are persisted."""
         registry_path = temp_dir / "agents.json"
@@ -7,7 +7,9 @@ Unit tests for LedgerWriter.
 Tests the core functionality of appending events to the immutable ledger.
 """
 
+import gc
 import json
+import mmap
 from decimal import Decimal
 from pathlib import Path
 
@@ -17,6 +19,28 @@ from caracal.core.ledger import LedgerEvent, LedgerWriter
 from caracal.exceptions import InvalidLedgerEventError, LedgerWriteError
 
 
+def count_jsonl_lines(path: Path) -> int:
+    """Count newline-terminated lines in a JSON Lines file via mmap."""
+    with open(path, 'rb') as f:
+        if f.seek(0, 2) == 0:
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            count = 0
+            pos = buf.find(b'\n')
+            while pos != -1:
+                count += 1
+                pos = buf.find(b'\n', pos + 1)
+            return count
+
+
+def read_last_jsonl_line(path: Path) -> dict:
+    """Parse the last line of a JSON Lines file via mmap."""
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            start = buf.rfind(b'\n', 0, len(buf) - 1) + 1
+            return json.loads(buf[start:])
+
+
 class TestLedgerEvent:
     """Tests for LedgerEvent dataclass."""
     
@@ -75,6 +99,20 @@ class TestLedgerEvent:
         # Should not contain newlines (single line)
         assert '\n' not in json_line
 
+    @pytest.mark.parametrize("metadata", [None, {"model": "gpt-5.2", "note": "caf\u00e9 \"quoted\""}])
+    def test_ledger_event_to_json_line_fast_matches(self, metadata):
+        """Test that the template serializer matches to_json_line exactly."""
+        event = LedgerEvent(
+            event_id=42,
+            agent_id="agent-\u00fc\"1\"",
+            timestamp="2024-01-15T10:30:00Z",
+            resource_type="openai.gpt-5.2.input_tokens",
+            quantity="1.500000",
+            metadata=metadata
+        )
+        
+        assert event.to_json_line_fast() == event.to_json_line()
+
 
 class TestLedgerWriter:
     """Tests for LedgerWriter."""
@@ -106,11 +144,8 @@ class TestLedgerWriter:
         assert event.quantity == "1"
         
         # Verify event was written to file
-        with open(ledger_path, 'r') as f:
-            lines = f.readlines()
-        
-        assert len(lines) == 1
-        parsed = json.loads(lines[0])
+        assert count_jsonl_lines(ledger_path) == 1
+        parsed = read_last_jsonl_line(ledger_path)
         assert parsed["event_id"] == 1
         assert parsed["agent_id"] == "test-agent-123"
     
@@ -144,10 +179,7 @@ class TestLedgerWriter:
         assert event3.event_id == 3
         
         # Verify all events written to file
-        with open(ledger_path, 'r') as f:
-            lines = f.readlines()
-        
-        assert len(lines) == 3
+        assert count_jsonl_lines(ledger_path) == 3
     
     def test_ledger_writer_loads_existing_ledger(self, temp_dir):
         """Test that ledger writer continues event IDs from existing ledger."""
@@ -180,6 +212,30 @@ class TestLedgerWriter:
         
         assert event3.event_id == 3
     
+    def test_concurrent_append_unique_ordered_ids(self, temp_dir):
+        """Test that concurrent writers get unique IDs written in order."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        ledger_path = temp_dir / "ledger.jsonl"
+        writer = LedgerWriter(str(ledger_path))
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            events = list(pool.map(
+                lambda i: writer.append_event(
+                    agent_id=f"agent-{i}",
+                    resource_type="resource-1",
+                    quantity=Decimal("1")
+                ),
+                range(40)
+            ))
+        
+        assert sorted(e.event_id for e in events) == list(range(1, 41))
+        
+        with open(ledger_path, 'r') as f:
+            written_ids = [json.loads(line)["event_id"] for line in f]
+        
+        assert written_ids == list(range(1, 41))
+    
     def test_invalid_agent_id(self, temp_dir):
         """Test that empty agent_id raises error."""
         ledger_path = temp_dir / "ledger.jsonl"
@@ -216,6 +272,89 @@ class TestLedgerWriter:
                 quantity=Decimal("-100")
             )
     
+    def test_append_event_string_quantity(self, temp_dir):
+        """Test that string quantities are stored without coercion."""
+        ledger_path = temp_dir / "ledger.jsonl"
+        writer = LedgerWriter(str(ledger_path))
+        
+        event = writer.append_event(
+            agent_id="agent-1",
+            resource_type="resource-1",
+            quantity="1.500000"
+        )
+        zero_event = writer.append_event(
+            agent_id="agent-1",
+            resource_type="resource-1",
+            quantity="-0"
+        )
+        
+        assert event.quantity == "1.500000"
+        assert zero_event.quantity == "-0"
+        
+        with pytest.raises(InvalidLedgerEventError, match="quantity must be non-negative"):
+            writer.append_event(
+                agent_id="agent-1",
+                resource_type="resource-1",
+                quantity="-0.5"
+            )
+    
+    @pytest.mark.parametrize(
+        "quantity, message",
+        [
+            (" -1", "non-negative"),
+            ("-abc", "not a decimal"),
+            ("abc", "not a decimal"),
+            ("", "not a decimal"),
+            ("NaN", "finite"),
+            ("Infinity", "finite"),
+            (Decimal("NaN"), "finite"),
+            (Decimal("-Infinity"), "finite"),
+            (None, "str, int or Decimal"),
+            (1.5, "str, int or Decimal"),
+            (True, "str, int or Decimal"),
+            (-1, "non-negative"),
+        ],
+    )
+    def test_invalid_quantity_rejected(self, temp_dir, quantity, message):
+        """Test that unparseable, non-finite and non-decimal quantities are rejected."""
+        ledger_path = temp_dir / "ledger.jsonl"
+        writer = LedgerWriter(str(ledger_path))
+        
+        with pytest.raises(InvalidLedgerEventError, match=message):
+            writer.append_event(
+                agent_id="agent-1",
+                resource_type="resource-1",
+                quantity=quantity
+            )
+        
+        assert count_jsonl_lines(ledger_path) == 0
+    
+    def test_non_plain_string_quantity_normalized(self, temp_dir):
+        """Test that strings outside the plain decimal form are stored canonically."""
+        ledger_path = temp_dir / "ledger.jsonl"
+        writer = LedgerWriter(str(ledger_path))
+        
+        event = writer.append_event(
+            agent_id="agent-1",
+            resource_type="resource-1",
+            quantity=" 2.5 "
+        )
+        
+        assert event.quantity == "2.5"
+    
+    def test_int_quantity_accepted(self, temp_dir):
+        """Test that integer quantities are stored as their decimal string."""
+        ledger_path = temp_dir / "ledger.jsonl"
+        writer = LedgerWriter(str(ledger_path))
+        
+        event = writer.append_event(
+            agent_id="agent-1",
+            resource_type="resource-1",
+            quantity=5
+        )
+        
+        assert event.quantity == "5"
+    
     def test_backup_creation(self, temp_dir):
         """Test that backup is created on first write."""
         ledger_path = temp_dir / "ledger.jsonl"
@@ -244,6 +383,163 @@ class TestLedgerWriter:
         
         assert "old-agent" in backup_content
     
+    def test_backup_rotation(self, temp_dir):
+        """Test that existing backups are shifted and the oldest dropped."""
+        ledger_path = temp_dir / "ledger.jsonl"
+        ledger_path.write_text('{"event_id":1,"agent_id":"current","timestamp":"2024-01-01T00:00:00Z","resource_type":"test","quantity":"1"}\n')
+        for i in (1, 2, 3):
+            Path(f"{ledger_path}.bak.{i}").write_text(f"backup-{i}")
+        
+        writer = LedgerWriter(str(ledger_path), backup_count=3)
+        writer.append_event(
+            agent_id="new-agent",
+            resource_type="resource-1",
+            quantity=Decimal("1")
+        )
+        
+        assert "current" in Path(f"{ledger_path}.bak.1").read_text()
+        assert Path(f"{ledger_path}.bak.2").read_text() == "backup-1"
+        assert Path(f"{ledger_path}.bak.3").read_text() == "backup-2"
+        assert not Path(f"{ledger_path}.bak.4").exists()
+
+    def test_flush_every_n_batches_writes(self, temp_dir):
+        """Test that buffered events reach the file in batches and on close."""
+        ledger_path = temp_dir / "ledger.jsonl"
+        writer = LedgerWriter(str(ledger_path), flush_every_n=3)
+
+        for i in range(2):
+            writer.append_event(
+                agent_id=f"agent-{i}",
+                resource_type="resource-1",
+                quantity=Decimal("1")
+            )
+        assert ledger_path.stat().st_size == 0
+
+        writer.append_event(
+            agent_id="agent-2",
+            resource_type="resource-1",
+            quantity=Decimal("1")
+        )
+        assert count_jsonl_lines(ledger_path) == 3
+
+        writer.append_event(
+            agent_id="agent-3",
+            resource_type="resource-1",
+            quantity=Decimal("1")
+        )
+        writer.close()
+        assert count_jsonl_lines(ledger_path) == 4
+        assert read_last_jsonl_line(ledger_path)["event_id"] == 4
+
+    def test_append_events_single_fsync(self, temp_dir, monkeypatch):
+        """Test that a batch is written with one fsync and sequential IDs."""
+        import os
+
+        ledger_path = temp_dir / "ledger.jsonl"
+        writer = LedgerWriter(str(ledger_path))
+        fsyncs = []
+        real_fsync = os.fsync
+        monkeypatch.setattr(os, "fsync", lambda fd: (fsyncs.append(fd), real_fsync(fd)))
+
+        events = writer.append_events([
+            {"agent_id": f"agent-{i}", "resource_type": "resource-1", "quantity": Decimal(i)}
+            for i in range(4)
+        ])
+
+        assert [e.event_id for e in events] == [1, 2, 3, 4]
+        assert len(fsyncs) == 1
+        assert count_jsonl_lines(ledger_path) == 4
+        assert read_last_jsonl_line(ledger_path)["agent_id"] == "agent-3"
+
+    def test_append_events_validates_before_writing(self, temp_dir):
+        """Test that one invalid event rejects the whole batch."""
+        ledger_path = temp_dir / "ledger.jsonl"
+        writer = LedgerWriter(str(ledger_path))
+
+        with pytest.raises(InvalidLedgerEventError):
+            writer.append_events([
+                {"agent_id": "agent-1", "resource_type": "resource-1", "quantity": "1"},
+                {"agent_id": "agent-2", "resource_type": "resource-1", "quantity": "-1"},
+            ])
+
+        assert ledger_path.stat().st_size == 0
+        assert writer.append_event(
+            agent_id="agent-1", resource_type="resource-1", quantity="1"
+        ).event_id == 1
+
+    def test_append_events_unserializable_metadata_queues_nothing(self, temp_dir):
+        """Test that a batch failing to serialize leaves none of its events queued."""
+        ledger_path = temp_dir / "ledger.jsonl"
+        writer = LedgerWriter(str(ledger_path))
+
+        with pytest.raises(TypeError):
+            writer.append_events([
+                {"agent_id": "agent-1", "resource_type": "resource-1", "quantity": "1"},
+                {"agent_id": "agent-2", "resource_type": "resource-1", "quantity": "1",
+                 "metadata": {"bad": object()}},
+            ])
+
+        writer.append_event(agent_id="agent-3", resource_type="resource-1", quantity="1")
+
+        with open(ledger_path, 'r') as f:
+            lines = f.readlines()
+
+        assert len(lines) == 1
+        assert json.loads(lines[0])["agent_id"] == "agent-3"
+
+    def test_context_manager_flushes_on_exit(self, temp_dir):
+        """Test that leaving a with-block writes buffered events."""
+        ledger_path = temp_dir / "ledger.jsonl"
+
+        with LedgerWriter(str(ledger_path), flush_every_n=100) as writer:
+            for i in range(3):
+                writer.append_event(
+                    agent_id=f"agent-{i}",
+                    resource_type="resource-1",
+                    quantity=Decimal("1")
+                )
+            assert ledger_path.stat().st_size == 0
+
+        assert count_jsonl_lines(ledger_path) == 3
+
+    def test_unreferenced_writer_flushes_on_collection(self, temp_dir):
+        """Test that a writer dropped without close() still writes buffered events."""
+        ledger_path = temp_dir / "ledger.jsonl"
+        writer = LedgerWriter(str(ledger_path), flush_every_n=100)
+        writer.append_event(
+            agent_id="agent-1",
+            resource_type="resource-1",
+            quantity=Decimal("1")
+        )
+        assert ledger_path.stat().st_size == 0
+
+        del writer
+        gc.collect()
+
+        assert count_jsonl_lines(ledger_path) == 1
+
+    def test_unreferenced_writer_closes_file(self, temp_dir):
+        """Test that collecting a writer with nothing buffered closes its handle."""
+        ledger_path = temp_dir / "ledger.jsonl"
+        writer = LedgerWriter(str(ledger_path))
+        writer.append_event(
+            agent_id="agent-1",
+            resource_type="resource-1",
+            quantity=Decimal("1")
+        )
+        handle = writer._file
+        assert handle is not None and not handle.closed
+
+        del writer
+        gc.collect()
+
+        assert handle.closed
+
+    def test_flush_every_n_must_be_positive(self, temp_dir):
+        """Test that flush_every_n below 1 is rejected."""
+        with pytest.raises(ValueError):
+            LedgerWriter(str(temp_dir / "ledger.jsonl"), flush_every_n=0)
+
     def test_json_lines_format(self, temp_dir):
         """Test that ledger uses JSON Lines format (one JSON per line)."""
         ledger_path = temp_dir / "ledger.jsonl"
@@ -491,3 +787,27 @@ class TestLedgerQuery:
         assert len(events) == 2
         assert events[0].agent_id == "agent-1"
         assert events[1].agent_id == "agent-2"
+    
+    def test_get_events_filter_by_non_ascii_agent_id(self, temp_dir):
+        """Test agent filtering matches both escaped and raw UTF-8 lines."""
+        from caracal.core.ledger import LedgerQuery
+        
+        ledger_path = temp_dir / "ledger.jsonl"
+        writer = LedgerWriter(str(ledger_path))
+        writer.append_event(
+            agent_id="agent-é",
+            resource_type="resource-1",
+            quantity=Decimal("100")
+        )
+        writer.append_event(
+            agent_id="agent-e",
+            resource_type="resource-1",
+            quantity=Decimal("200")
+        )
+        with open(ledger_path, 'a', encoding='utf-8') as f:
+            f.write('{"event_id":3,"agent_id":"agent-é","timestamp":"2024-01-15T10:00:00Z","resource_type":"test","quantity":"300"}')
+        
+        query = LedgerQuery(str(ledger_path))
+        events = query.get_events(agent_id="agent-é")
+        
+        assert [e.quantity for e in events] == ["100", "300"]
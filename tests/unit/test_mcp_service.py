@@ -84,8 +84,7 @@ class TestMCPServiceInitialization:
 class TestMCPServiceHealthCheck:
     """Test MCP Adapter Service health check endpoint."""
     
-    @pytest.mark.asyncio
-    async def test_health_check_all_healthy(self, mcp_service):
+    def test_health_check_all_healthy(self, mcp_service):
         """Test health check returns healthy when all dependencies are healthy."""
         from fastapi.testclient import TestClient
         
@@ -111,8 +110,7 @@ class TestMCPServiceHealthCheck:
         assert data["mcp_servers"]["test-server-1"] == "healthy"
         assert data["mcp_servers"]["test-server-2"] == "healthy"
     
-    @pytest.mark.asyncio
-    async def test_health_check_degraded_db_unhealthy(self, mcp_service):
+    def test_health_check_degraded_db_unhealthy(self, mcp_service):
         """Test health check returns 503 degraded when database is unhealthy."""
         from fastapi.testclient import TestClient
         
@@ -137,8 +135,7 @@ class TestMCPServiceHealthCheck:
         assert data["mcp_servers"]["test-server-1"] == "healthy"
         assert data["mcp_servers"]["test-server-2"] == "healthy"
     
-    @pytest.mark.asyncio
-    async def test_health_check_degraded_mcp_server_unhealthy(self, mcp_service):
+    def test_health_check_degraded_mcp_server_unhealthy(self, mcp_service):
         """Test health check returns 503 degraded when MCP server is unhealthy."""
         from fastapi.testclient import TestClient
         
@@ -170,8 +167,7 @@ class TestMCPServiceHealthCheck:
         assert data["mcp_servers"]["test-server-1"] == "healthy"
         assert "unhealthy" in data["mcp_servers"]["test-server-2"]
     
-    @pytest.mark.asyncio
-    async def test_health_check_mcp_server_timeout(self, mcp_service):
+    def test_health_check_mcp_server_timeout(self, mcp_service):
         """Test health check handles MCP server timeout."""
         from fastapi.testclient import TestClient
         
@@ -200,8 +196,7 @@ class TestMCPServiceHealthCheck:
         assert data["mcp_servers"]["test-server-1"] == "healthy"
         assert "timeout" in data["mcp_servers"]["test-server-2"]
     
-    @pytest.mark.asyncio
-    async def test_health_check_mcp_server_connection_error(self, mcp_service):
+    def test_health_check_mcp_server_connection_error(self, mcp_service):
         """Test health check handles MCP server connection error."""
         from fastapi.testclient import TestClient
         
@@ -230,8 +225,7 @@ class TestMCPServiceHealthCheck:
         assert data["mcp_servers"]["test-server-1"] == "healthy"
         assert "connection_failed" in data["mcp_servers"]["test-server-2"]
     
-    @pytest.mark.asyncio
-    async def test_health_check_without_db(self, mcp_service):
+    def test_health_check_without_db(self, mcp_service):
         """Test health check when no database configured."""
         from fastapi.testclient import TestClient
         
@@ -254,8 +248,7 @@ class TestMCPServiceHealthCheck:
         assert data["mcp_servers"]["test-server-1"] == "healthy"
         assert data["mcp_servers"]["test-server-2"] == "healthy"
     
-    @pytest.mark.asyncio
-    async def test_health_check_db_exception(self, mcp_service):
+    def test_health_check_db_exception(self, mcp_service):
         """Test health check handles database exceptions gracefully."""
         from fastapi.testclient import TestClient
         
@@ -158,8 +158,7 @@ class TestMerkleVerifierIntegration:
     """
     
     @pytest.mark.skip(reason="Requires database fixtures - run with integration tests")
-    @pytest.mark.asyncio
-    async def test_verify_batch_success(self):
+    def test_verify_batch_success(self):
         """Test successful batch verification (requires database)."""
         # This test would require:
         # - async_session fixture
@@ -168,14 +167,12 @@ class TestMerkleVerifierIntegration:
         pass
     
     @pytest.mark.skip(reason="Requires database fixtures - run with integration tests")
-    @pytest.mark.asyncio
-    async def test_verify_time_range(self):
+    def test_verify_time_range(self):
         """Test time range verification (requires database)."""
         pass
     
     @pytest.mark.skip(reason="Requires database fixtures - run with integration tests")
-    @pytest.mark.asyncio
-    async def test_verify_event_inclusion(self):
+    def test_verify_event_inclusion(self):
         """Test event inclusion verification (requires database)."""
         pass
 
@@ -57,6 +57,15 @@ class TestMockAdapter:
         adapter.close()
         assert adapter.is_connected is True  # mock is always "connected"
 
+    @pytest.mark.asyncio
+    async def test_close_leaves_caller_responses_intact(self):
+        responses = {("GET", "/x"): SDKResponse(status_code=200)}
+        adapter = MockAdapter(responses=responses)
+        adapter.close()
+        assert len(responses) == 1
+        result = await adapter.send(SDKRequest(method="GET", path="/x", headers={}))
+        assert result.status_code == 404
+
 
 class TestHttpAdapter:
     def test_initialization(self):
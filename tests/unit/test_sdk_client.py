@@ -99,6 +99,17 @@ class TestCaracalClientV2:
         assert client._adapter._base_url == "https://api.example.com"
         client.close()
 
+    def test_from_api_key(self):
+        """CaracalClient.from_api_key() builds an HTTP client without a builder."""
+        from caracal.sdk.client import CaracalClient
+        from caracal.sdk.adapters.http import HttpAdapter
+
+        client = CaracalClient.from_api_key("sk_test_789", base_url="https://api.example.com")
+        assert isinstance(client._adapter, HttpAdapter)
+        assert client._adapter._api_key == "sk_test_789"
+        assert client._adapter._base_url == "https://api.example.com"
+        client.close()
+
     def test_init_with_mock_adapter(self):
         """CaracalClient with custom adapter skips api_key requirement."""
         from caracal.sdk.client import CaracalClient